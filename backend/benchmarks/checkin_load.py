@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+LOAD TEST: Latencia de check-in con N check-ins concurrentes
+============================================================================
+
+Lanza oleadas de POST /visits/checkin/ contra un backend en marcha y
+muestra p50/p95/p99 por nivel de concurrencia. Con el camino async
+(asyncpg + AsyncSession) el p99 debe mantenerse plano a 50+ concurrentes.
+
+⚠️ Crea vendedor, clientes, rutas y visitas: usar contra BD de staging.
+
+USO:
+    python benchmarks/checkin_load.py --base-url http://localhost:8000
+    python benchmarks/checkin_load.py --concurrency 1 10 50 100 --rounds 5
+============================================================================
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+# Polígono industrial de Gandia
+BASE_LAT, BASE_LNG = 38.9680, -0.1810
+
+
+async def create_fixtures(http: httpx.AsyncClient, n_routes: int) -> tuple[str, list[tuple[str, str]]]:
+    """Crea un vendedor y N clientes/rutas; devuelve (seller_id, [(route_id, client_id)])"""
+    seller = await http.post("/sellers/", json={
+        "name": "Load Test Seller",
+        "email": f"load-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    })
+    seller.raise_for_status()
+    seller_id = seller.json()["id"]
+
+    stops = []
+    for i in range(n_routes):
+        client = await http.post("/clients/", json={
+            "name": f"Load Test Cliente {i}",
+            "address": "Polígono Alcodar",
+            "phone": "962000000",
+            "client_type": "taller",
+            "latitude": BASE_LAT + i * 0.0001,
+            "longitude": BASE_LNG
+        })
+        client.raise_for_status()
+        client_id = client.json()["id"]
+
+        route = await http.post("/routes/", json={
+            "seller_id": seller_id,
+            "client_id": client_id,
+            "planned_date": time.strftime("%Y-%m-%d")
+        })
+        route.raise_for_status()
+        stops.append((route.json()["id"], client_id))
+
+    return seller_id, stops
+
+
+async def timed_checkin(http: httpx.AsyncClient, seller_id: str, route_id: str, client_id: str) -> float:
+    """Un check-in; devuelve la latencia en ms"""
+    start = time.perf_counter()
+    response = await http.post("/visits/checkin/", json={
+        "route_id": route_id,
+        "seller_id": seller_id,
+        "client_id": client_id,
+        "latitude": BASE_LAT,
+        "longitude": BASE_LNG,
+        "client_found": True,
+        "notes": "load test"
+    })
+    elapsed = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return elapsed
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run(base_url: str, levels: list[int], rounds: int):
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as http:
+        print(f"⏳ Creando datos de prueba ({max(levels)} rutas)...")
+        seller_id, stops = await create_fixtures(http, max(levels))
+
+        print(f"\n{'concurrentes':>12} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for level in levels:
+            latencies = []
+            for _ in range(rounds):
+                batch = stops[:level]
+                latencies += await asyncio.gather(*[
+                    timed_checkin(http, seller_id, route_id, client_id)
+                    for route_id, client_id in batch
+                ])
+            print(
+                f"{level:>12} {len(latencies):>6} "
+                f"{statistics.median(latencies):>9.1f} "
+                f"{percentile(latencies, 95):>9.1f} "
+                f"{percentile(latencies, 99):>9.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test de check-in concurrente")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.base_url, args.concurrency, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+BENCHMARK: Distancias haversine (bucle calculate_distance vs NumPy)
+============================================================================
+
+Compara el cálculo punto a punto con el kernel vectorizado para los
+tamaños típicos: ruta de un día (60 paradas), cercanía sobre toda la
+cartera de clientes y matriz completa para planificación.
+
+No requiere BD ni backend en marcha.
+
+USO:
+    python benchmarks/distance_matrix.py
+    python benchmarks/distance_matrix.py --clients 100000 --stops 60 80
+============================================================================
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Agregar path del backend para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import calculate_distance, haversine_matrix, haversine_one_to_many
+
+
+# Polígono industrial de Gandia
+BASE_LAT, BASE_LNG = 38.9680, -0.1810
+
+
+def random_coords(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """N puntos en ~50 km alrededor de Gandia"""
+    rng = random.Random(n)
+    lats = np.array([BASE_LAT + rng.uniform(-0.45, 0.45) for _ in range(n)])
+    lngs = np.array([BASE_LNG + rng.uniform(-0.55, 0.55) for _ in range(n)])
+    return lats, lngs
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """Mejor tiempo de `repeat` ejecuciones, en ms"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def report(label: str, loop_ms: float, numpy_ms: float):
+    print(f"{label:<32} {loop_ms:>10.2f} {numpy_ms:>10.2f} {loop_ms / max(numpy_ms, 1e-6):>8.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de distancias haversine")
+    parser.add_argument("--clients", type=int, default=20000, help="Clientes para uno-a-muchos")
+    parser.add_argument("--stops", type=int, nargs="+", default=[60, 200], help="Paradas para la matriz N×N")
+    args = parser.parse_args()
+
+    print(f"\n{'caso':<32} {'bucle ms':>10} {'numpy ms':>10} {'mejora':>8}")
+
+    lats, lngs = random_coords(args.clients)
+    lat_list, lng_list = lats.tolist(), lngs.tolist()
+    report(
+        f"1 → {args.clients} clientes",
+        timed(lambda: [calculate_distance(BASE_LAT, BASE_LNG, la, ln) for la, ln in zip(lat_list, lng_list)]),
+        timed(lambda: haversine_one_to_many(BASE_LAT, BASE_LNG, lats, lngs))
+    )
+
+    for n in args.stops:
+        stop_lats, stop_lngs = random_coords(n)
+        pairs = [(a, b, c, d) for a, b in zip(stop_lats.tolist(), stop_lngs.tolist())
+                 for c, d in zip(stop_lats.tolist(), stop_lngs.tolist())]
+        report(
+            f"matriz {n}×{n}",
+            timed(lambda: [calculate_distance(*pair) for pair in pairs]),
+            timed(lambda: haversine_matrix(stop_lats, stop_lngs))
+        )
+
+
+if __name__ == "__main__":
+    main()
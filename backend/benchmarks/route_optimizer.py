@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+BENCHMARK: Optimizador de rutas (vecino más cercano vs + 2-opt/Or-opt)
+============================================================================
+
+Mide optimize_visit_order para rutas de un día (objetivo: < 200 ms con
+60 paradas) y la mejora de la búsqueda local sobre el vecino más cercano.
+
+No requiere BD ni backend en marcha.
+
+USO:
+    python benchmarks/route_optimizer.py
+    python benchmarks/route_optimizer.py --stops 30 60 120
+============================================================================
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Agregar path del backend para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import haversine_matrix, haversine_one_to_many, optimize_visit_order, path_length
+
+
+# Polígono industrial de Gandia
+BASE_LAT, BASE_LNG = 38.9680, -0.1810
+TARGET_MS = 200
+
+
+def random_stops(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """N paradas en ~50 km alrededor de Gandia"""
+    rng = random.Random(seed)
+    lats = np.array([BASE_LAT + rng.uniform(-0.4, 0.4) for _ in range(n)])
+    lngs = np.array([BASE_LNG + rng.uniform(-0.5, 0.5) for _ in range(n)])
+    return lats, lngs
+
+
+def timed(fn, repeat: int = 3) -> tuple[float, object]:
+    """Mejor tiempo de `repeat` ejecuciones (ms) y último resultado"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del optimizador de rutas")
+    parser.add_argument("--stops", type=int, nargs="+", default=[20, 60, 120], help="Paradas por ruta")
+    parser.add_argument("--seeds", type=int, default=5, help="Rutas aleatorias por tamaño")
+    args = parser.parse_args()
+
+    print(f"\n{'paradas':>8} {'NN km':>10} {'opt km':>10} {'mejora':>8} {'ms (peor)':>10}")
+
+    for n in args.stops:
+        nn_km = opt_km = worst_ms = 0.0
+        for seed in range(args.seeds):
+            lats, lngs = random_stops(n, seed)
+            matrix = haversine_matrix(lats, lngs)
+            start = haversine_one_to_many(BASE_LAT, BASE_LNG, lats, lngs)
+
+            nn = optimize_visit_order(matrix, start, max_passes=0)
+            elapsed_ms, order = timed(lambda: optimize_visit_order(matrix, start))
+            nn_km += path_length(nn, matrix, start) / 1000
+            opt_km += path_length(order, matrix, start) / 1000
+            worst_ms = max(worst_ms, elapsed_ms)
+
+        flag = "✅" if n > 60 or worst_ms < TARGET_MS else "⚠️"
+        print(f"{n:>8} {nn_km / args.seeds:>10.1f} {opt_km / args.seeds:>10.1f} "
+              f"{(1 - opt_km / nn_km) * 100:>7.1f}% {worst_ms:>9.1f} {flag}")
+
+
+if __name__ == "__main__":
+    main()
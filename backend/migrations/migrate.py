@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+MIGRACIONES DE ESQUEMA VERSIONADAS (schema_migrations)
+============================================================================
+
+Aplica las migraciones pendientes definidas en main.SCHEMA_MIGRATIONS bajo
+un advisory lock (seguro aunque los workers estén arrancando a la vez).
+
+Recomendado en producción: migrar en el deploy y arrancar los workers con
+RUN_MIGRATIONS_ON_STARTUP=false.
+
+USO:
+    # Ver versiones aplicadas y pendientes
+    python migrations/migrate.py --status
+
+    # Aplicar pendientes
+    python migrations/migrate.py
+
+    # Reintentar migraciones opcionales omitidas (p.ej. pg_trgm instalado después)
+    python migrations/migrate.py --retry-skipped
+============================================================================
+"""
+
+import os
+import sys
+import argparse
+
+# Agregar path del backend para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import (
+    SCHEMA_MIGRATIONS, engine, apply_schema_migrations,
+    pending_schema_migrations, read_schema_migrations
+)
+
+
+def show_status():
+    with engine.connect() as conn:
+        applied = read_schema_migrations(conn) or {}
+
+    print(f"\n{'Versión':<9} {'Migración':<28} Estado")
+    print("-" * 50)
+    for migration in SCHEMA_MIGRATIONS:
+        if migration.version not in applied:
+            status = "⏳ pendiente"
+        elif applied[migration.version]:
+            status = "⚠️ omitida"
+        else:
+            status = "✅ aplicada"
+        print(f"{migration.version:<9} {migration.name:<28} {status}")
+
+    print(f"\n📌 Pendientes: {len(pending_schema_migrations(applied))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migraciones de esquema versionadas")
+    parser.add_argument('--status', action='store_true', help='Ver estado sin aplicar cambios')
+    parser.add_argument('--retry-skipped', action='store_true', help='Reintentar migraciones opcionales omitidas')
+    args = parser.parse_args()
+
+    if not args.status:
+        apply_schema_migrations(retry_skipped=args.retry_skipped)
+    show_status()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 import os
@@ -8,7 +8,9 @@ import sys
 # Add backend to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from main import app, Base, get_db
+from contextlib import nullcontext
+
+from main import app, Base, get_db, get_async_db, get_stream_sessionmaker
 
 # Use an in-memory SQLite database or a separate test DB. 
 # Since we use PostGIS/Geography, SQLite with SpatiaLite is complex to set up.
@@ -47,17 +49,53 @@ def db(test_db_engine):
     transaction.rollback()
     connection.close()
 
+class RunSyncSession:
+    """
+    Adaptador para get_async_db en tests: ejecuta `run_sync` sobre la sesión
+    síncrona del test, así check-in/check-out comparten la transacción
+    que se revierte al final.
+    """
+    def __init__(self, session):
+        self.session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.session, *args, **kwargs)
+
 @pytest.fixture
 def client(db):
     """
-    FastAPI TestClient with overridden get_db dependency.
+    FastAPI TestClient with overridden get_db / get_async_db dependencies.
     """
     def override_get_db():
         try:
             yield db
         finally:
             pass
+
+    async def override_get_async_db():
+        yield RunSyncSession(db)
             
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Streaming: la misma sesión del test (sin cerrarla) para ver sus datos sin commit
+    app.dependency_overrides[get_stream_sessionmaker] = lambda: (lambda: nullcontext(db))
     yield TestClient(app)
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_async_db]
+    del app.dependency_overrides[get_stream_sessionmaker]
+
+
+@pytest.fixture
+def query_counter(test_db_engine):
+    """
+    Registra las sentencias SQL emitidas contra la BD de test.
+    Útil para verificar que un endpoint hace un número constante de queries.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_db_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_db_engine, "before_cursor_execute", _record)
@@ -0,0 +1,111 @@
+"""
+Camino asíncrono (asyncpg): conversión de DATABASE_URL y get_async_db real
+"""
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+import main
+from main import Client, Route, Seller, Visit, app, to_async_database_url
+
+GANDIA = (38.9680, -0.1810)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("postgresql://u:p@db:5432/app", "postgresql+asyncpg://u:p@db:5432/app"),
+    ("postgres://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+    ("postgresql+psycopg2://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+    ("postgresql+asyncpg://u:p@db/app?ssl=require", "postgresql+asyncpg://u:p@db/app?ssl=require"),
+])
+def test_async_url_rewrites_driver(url, expected):
+    assert to_async_database_url(url) == expected
+
+
+@pytest.mark.parametrize("mode", ["disable", "prefer", "require", "verify-ca", "verify-full"])
+def test_async_url_maps_sslmode_and_keeps_other_params(mode):
+    url = f"postgresql://u:p@db/app?application_name=tracker&sslmode={mode}&options=-csearch_path%3Dpublic"
+
+    assert to_async_database_url(url) == (
+        f"postgresql+asyncpg://u:p@db/app?application_name=tracker&ssl={mode}&options=-csearch_path%3Dpublic"
+    )
+
+
+def test_async_url_only_touches_the_sslmode_parameter():
+    # "sslmode=" dentro de la contraseña no es un parámetro
+    assert to_async_database_url("postgresql://u:sslmode%3Dx@db/app") == "postgresql+asyncpg://u:sslmode%3Dx@db/app"
+    # ssl explícito gana sobre sslmode
+    assert to_async_database_url("postgresql://u:p@db/app?sslmode=require&ssl=disable") == (
+        "postgresql+asyncpg://u:p@db/app?ssl=disable"
+    )
+
+
+@pytest.fixture
+def real_async_db(test_db_engine, monkeypatch):
+    """
+    get_async_db sin override: asyncpg + run_sync de verdad. NullPool porque
+    TestClient usa un event loop por petición (una conexión del pool quedaría
+    atada a un loop ya cerrado).
+    """
+    pytest.importorskip("asyncpg")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    engine = create_async_engine(main.ASYNC_DATABASE_URL, poolclass=NullPool)
+    monkeypatch.setattr(main, "_async_engine", engine)
+    main.AsyncSessionLocal.configure(bind=engine)
+    return TestClient(app)
+
+
+@pytest.fixture
+def committed_route(test_db_engine):
+    """Vendedor/cliente/ruta confirmados: la sesión asyncpg no ve la transacción del fixture db"""
+    with Session(test_db_engine) as session:
+        seller = Seller(name="Seller Async", email=f"async-{uuid.uuid4().hex[:8]}@test.com", phone="600000000")
+        client = Client(
+            name="Cliente Async", address="Polígono Alcodar", phone="962000000", client_type="taller",
+            location=f"SRID=4326;POINT({GANDIA[1]} {GANDIA[0]})"
+        )
+        session.add_all([seller, client])
+        session.flush()
+        route = Route(seller_id=seller.id, client_id=client.id, planned_date=datetime.now())
+        session.add(route)
+        session.commit()
+        ids = {"seller_id": str(seller.id), "client_id": str(client.id), "route_id": str(route.id)}
+    yield ids
+    with Session(test_db_engine) as session:
+        session.query(Visit).filter(Visit.route_id == ids["route_id"]).delete()
+        session.query(Route).filter(Route.id == ids["route_id"]).delete()
+        session.query(Client).filter(Client.id == ids["client_id"]).delete()
+        session.query(Seller).filter(Seller.id == ids["seller_id"]).delete()
+        session.commit()
+
+
+def test_checkin_through_real_async_session(real_async_db):
+    # Solo lectura: cliente inexistente → 404 desde el SELECT de checkin_context
+    response = real_async_db.post("/visits/checkin/", json={
+        "route_id": str(uuid.uuid4()),
+        "seller_id": str(uuid.uuid4()),
+        "client_id": str(uuid.uuid4()),
+        "latitude": GANDIA[0],
+        "longitude": GANDIA[1],
+        "client_found": True
+    })
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Cliente no encontrado"
+
+
+def test_checkin_then_checkout_on_asyncpg(real_async_db, committed_route):
+    checkin = real_async_db.post("/visits/checkin/", json={
+        **committed_route, "latitude": GANDIA[0], "longitude": GANDIA[1], "client_found": True
+    })
+    assert checkin.status_code == 200, checkin.text
+
+    checkout = real_async_db.post("/visits/checkout/", json={
+        "visit_id": checkin.json()["visit_id"], "latitude": GANDIA[0], "longitude": GANDIA[1]
+    })
+
+    assert checkout.status_code == 200, checkout.text
+    assert checkout.json()["distance_meters"] < 1
@@ -0,0 +1,36 @@
+"""
+Arranque rápido: importar main no debe cargar módulos de uso ocasional
+"""
+import os
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+import main
+from main import CLIENT_SEARCH_MIGRATION, app, read_schema_migrations, wait_for_database
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_defers_rarely_used_modules():
+    code = "import sys, main; print(','.join(m for m in ('bcrypt', 'asyncpg') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_health_reports_boot_mode():
+    # Sin context manager: no ejecuta startup (no requiere BD)
+    response = TestClient(app).get("/health/")
+    assert response.status_code == 200
+    assert "boot_timings" in response.json()
+
+
+def test_fast_boot_reads_client_search_migration(monkeypatch):
+    # BOOT_MODE=fast: trigram solo si la migración opcional 8 se aplicó de verdad
+    monkeypatch.setattr(main, "CLIENT_SEARCH_TRGM", None)
+    wait_for_database()
+    with main.engine.connect() as conn:
+        applied = read_schema_migrations(conn) or {}
+
+    assert main.CLIENT_SEARCH_TRGM is (applied.get(CLIENT_SEARCH_MIGRATION) is False)
@@ -0,0 +1,43 @@
+"""
+Tests de la búsqueda difusa de clientes (pg_trgm + unaccent)
+"""
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+import main
+from main import normalize_search_term
+
+
+def test_normalize_search_term_strips_accents():
+    assert normalize_search_term("  Cristalería MUÑOZ ") == "cristaleria munoz"
+    assert normalize_search_term("Àlvarez i Fills") == "alvarez i fills"
+
+
+@pytest.fixture
+def trgm_search(db, monkeypatch):
+    """Activa la búsqueda trigram si la BD de test tiene pg_trgm + f_unaccent"""
+    try:
+        with db.begin_nested():
+            db.execute(text("SELECT f_unaccent('ñ'), similarity('a', 'a')"))
+    except Exception:
+        pytest.skip("pg_trgm/unaccent no instalados en la BD de test")
+    monkeypatch.setattr(main, "CLIENT_SEARCH_TRGM", True)
+
+
+def test_search_ignores_accents_and_typos(client, trgm_search):
+    tag = uuid.uuid4().hex[:6]
+    resp = client.post("/clients/", json={
+        "name": f"Cristalería Muñoz {tag}",
+        "address": "Carrer Major 1, Gandia",
+        "phone": "962000000",
+        "client_type": "cristalero",
+        "latitude": 38.968,
+        "longitude": -0.181
+    })
+    client_id = resp.json()["id"]
+
+    for q in ("cristaleria munoz", "Cristalería", "cristaleira munoz"):
+        results = client.get("/clients/search/", params={"q": f"{q} {tag}"}).json()
+        assert client_id in [c["id"] for c in results], q
@@ -0,0 +1,56 @@
+"""
+Tests de paginación keyset (cursor) en GET /clients/
+"""
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from main import encode_client_cursor, decode_client_cursor
+
+
+def test_cursor_roundtrip():
+    client_id = uuid.uuid4()
+    cursor = encode_client_cursor("Cristalería Muñoz", client_id)
+    assert "=" not in cursor
+    assert decode_client_cursor(cursor) == ("Cristalería Muñoz", client_id)
+
+
+def test_invalid_cursor_rejected():
+    with pytest.raises(HTTPException) as exc:
+        decode_client_cursor("no-es-un-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_cursor_pages_cover_all_clients(client):
+    prefix = f"Keyset {uuid.uuid4().hex[:6]}"
+    created = set()
+    for i in range(5):
+        resp = client.post("/clients/", json={
+            "name": f"{prefix} {i % 3}",  # nombres repetidos: desempate por id
+            "address": "Calle Mayor, Gandia",
+            "phone": "962000000",
+            "client_type": "otros",
+            "latitude": 38.968,
+            "longitude": -0.181
+        })
+        created.add(resp.json()["id"])
+
+    seen = []
+    cursor = None
+    while True:
+        url = f"/clients/?search={prefix}&limit=2&include_total=false"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url).json()
+        assert data["pagination"]["total"] is None
+        seen += [c["id"] for c in data["data"]]
+        cursor = data["pagination"]["next_cursor"]
+        if not data["pagination"]["has_next"]:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert set(seen) == created
+
+    first_page = client.get(f"/clients/?search={prefix}&limit=2").json()
+    assert first_page["pagination"]["total"] == 5
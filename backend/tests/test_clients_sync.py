@@ -0,0 +1,91 @@
+"""
+Tests del sync incremental de clientes (sync_token + tombstones)
+"""
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import main
+
+
+def _create_client(client, name):
+    resp = client.post("/clients/", json={
+        "name": name,
+        "address": "Avinguda República Argentina, Gandia",
+        "phone": "962000000",
+        "client_type": "instalador",
+        "latitude": 38.968,
+        "longitude": -0.181
+    })
+    assert resp.status_code == 200
+    return resp.json()["id"]
+
+
+def test_sync_returns_only_changes_and_deletions(client, monkeypatch):
+    monkeypatch.setattr(main, "SYNC_OVERLAP_SECONDS", 0)
+    tag = uuid.uuid4().hex[:6]
+    unchanged_id = _create_client(client, f"Sin cambios {tag}")
+    edited_id = _create_client(client, f"Editado {tag}")
+    deleted_id = _create_client(client, f"Borrado {tag}")
+
+    full = client.get("/clients/sync/").json()
+    assert full["full_sync"] is True
+    assert {unchanged_id, edited_id, deleted_id} <= {c["id"] for c in full["clients"]}
+
+    client.put(f"/clients/{edited_id}", json={"status": "inactive", "latitude": 38.97, "longitude": -0.18})
+    client.delete(f"/clients/{deleted_id}")
+
+    delta = client.get("/clients/sync/", params={"sync_token": full["sync_token"]}).json()
+    changed = {c["id"]: c for c in delta["clients"]}
+    assert delta["full_sync"] is False
+    assert edited_id in changed
+    assert changed[edited_id]["status"] == "inactive"
+    assert unchanged_id not in changed
+    assert deleted_id in delta["deleted_ids"]
+
+
+def test_sync_token_older_than_tombstone_retention_forces_full_sync(client):
+    stale = main.encode_sync_token(datetime.utcnow() - main.SYNC_TOMBSTONE_RETENTION - timedelta(days=1))
+
+    resp = client.get("/clients/sync/", params={"sync_token": stale}).json()
+
+    assert resp["full_sync"] is True
+    assert resp["deleted_ids"] == []
+
+
+def test_sync_rejects_invalid_token(client):
+    resp = client.get("/clients/sync/", params={"sync_token": "basura"})
+    assert resp.status_code == 400
+
+
+def test_sync_etag_returns_304_when_unchanged(client):
+    _create_client(client, f"ETag {uuid.uuid4().hex[:6]}")
+
+    first = client.get("/clients/sync/")
+    etag = first.headers["etag"]
+
+    cached = client.get("/clients/sync/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    _create_client(client, f"ETag nuevo {uuid.uuid4().hex[:6]}")
+    changed = client.get("/clients/sync/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_sync_streaming_formats_match_json(client):
+    _create_client(client, f"Streaming {uuid.uuid4().hex[:6]}")
+
+    plain = client.get("/clients/sync/").json()
+    expected_ids = {c["id"] for c in plain["clients"]}
+
+    lines = [json.loads(line) for line in client.get("/clients/sync/?format=ndjson").text.splitlines()]
+    assert lines[0]["type"] == "meta"
+    assert lines[-1] == {"type": "end", "synced_count": len(expected_ids)}
+    assert {row["id"] for row in lines[1:-1]} == expected_ids
+
+    columnar = client.get("/clients/sync/?format=columnar").json()
+    id_index = columnar["columns"].index("id")
+    assert {row[id_index] for row in columnar["rows"]} == expected_ids
+    assert columnar["synced_count"] == len(expected_ids)
+    assert "sync_token" in columnar
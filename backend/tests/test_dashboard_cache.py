@@ -0,0 +1,82 @@
+"""
+Tests de la caché del dashboard (no requieren PostgreSQL)
+"""
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+
+from main import SharedCache, TTLCache, local_day_bounds, parse_date_range
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(ttl_seconds=0.05, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")          # "a" pasa a ser el más reciente
+    cache.set("c", 3)       # expulsa "b" (LRU)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_shared_cache_coalesces_concurrent_misses():
+    cache = SharedCache("test-dashboard", ttl_seconds=30)
+    calls = []
+
+    def producer():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"visits": 42}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.compute("stats", producer))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"visits": 42}] * 8
+
+
+def test_shared_cache_invalidate_forces_recompute():
+    cache = SharedCache("test-dashboard-invalidate", ttl_seconds=30)
+    counter = iter(range(100))
+
+    first = cache.compute("stats", lambda: next(counter))
+    assert cache.compute("stats", lambda: next(counter)) == first
+
+    cache.invalidate()
+    assert cache.compute("stats", lambda: next(counter)) == first + 1
+
+
+def test_shared_cache_discards_value_computed_across_invalidate():
+    cache = SharedCache("test-dashboard-race", ttl_seconds=30)
+
+    def producer():
+        cache.invalidate()  # Un check-in escribe mientras se calculan los agregados
+        return {"visits": 41}
+
+    assert cache.compute("stats", producer) == {"visits": 41}
+    assert cache.compute("stats", lambda: {"visits": 42}) == {"visits": 42}
+
+
+def test_local_day_bounds_is_half_open_range():
+    first_day, last_day = parse_date_range("2025-03-29", "2025-03-30")
+    start, end = local_day_bounds(first_day, last_day)
+    assert start == datetime(2025, 3, 29)
+    assert end == datetime(2025, 3, 31)
+
+    assert parse_date_range("2025-03-29", None) == (date(2025, 3, 29), date(2025, 3, 29))
+
+
+def test_parse_date_range_rejects_invalid_input():
+    with pytest.raises(HTTPException):
+        parse_date_range("29/03/2025", None)
+    with pytest.raises(HTTPException):
+        parse_date_range("2025-03-30", "2025-03-29")
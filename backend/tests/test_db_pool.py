@@ -0,0 +1,50 @@
+"""
+Tests del pool instrumentado (no requieren PostgreSQL)
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from main import (
+    ASYNC_POOL_SETTINGS, POOL_SETTINGS, InstrumentedQueuePool, PoolWaitStats, connection_budget, pool_metrics
+)
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    monkeypatch.setattr(InstrumentedQueuePool, "wait_stats", PoolWaitStats())
+    pool = InstrumentedQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.05)
+    yield pool
+    pool.dispose()
+
+
+def test_pool_metrics_track_checkouts(small_pool):
+    conn = small_pool.connect()
+    metrics = pool_metrics(small_pool)
+    assert metrics["checked_out"] == 1
+    assert metrics["idle"] == 0
+    assert metrics["wait"]["checkouts"] == 1
+
+    conn.close()
+    metrics = pool_metrics(small_pool)
+    assert metrics["checked_out"] == 0
+    assert metrics["idle"] == 1
+
+
+def test_pool_metrics_record_timeouts(small_pool):
+    conn = small_pool.connect()
+    with pytest.raises(PoolTimeoutError):
+        small_pool.connect()
+    conn.close()
+
+    wait = pool_metrics(small_pool)["wait"]
+    assert wait["timeouts"] == 1
+    assert wait["max_wait_ms"] >= 50
+
+
+def test_connection_budget_counts_every_engine():
+    budget = connection_budget()
+
+    assert budget["async"] == ASYNC_POOL_SETTINGS["pool_size"] + ASYNC_POOL_SETTINGS["max_overflow"]
+    assert budget["per_worker"] == budget["sync"] + budget["async"] + budget["positions"]
@@ -0,0 +1,70 @@
+"""
+Feed de alertas de fraude: flags estructurados y paginación keyset
+"""
+import uuid
+from datetime import timedelta
+
+from main import (
+    Client, Seller, Route, Visit, WKTElement, get_local_time,
+    fraud_flags_to_details, parse_legacy_fraud_flags, format_fraud_details
+)
+
+
+def test_fraud_flag_conversions():
+    flags = ["OUT_OF_RANGE|250m", "CLIENT_NOT_FOUND", "MULTIPLE_LOCATIONS|2 check-ins en 1 minuto"]
+    details = fraud_flags_to_details(flags)
+
+    assert details[0] == {"type": "OUT_OF_RANGE", "detail": "250m"}
+    assert details[1] == {"type": "CLIENT_NOT_FOUND", "detail": None}
+    assert parse_legacy_fraud_flags("|".join(flags)) == details
+    assert format_fraud_details(details) == flags
+    assert fraud_flags_to_details([]) is None
+
+
+def _seed_alerts(db, n):
+    seller = Seller(name="Seller Fraude", email=f"fraud-{uuid.uuid4().hex[:8]}@test.com", phone="600000000")
+    client = Client(
+        name="Cliente Fraude", address="Polígono Alcodar", phone="962000000",
+        client_type="taller", location=WKTElement("POINT(-0.1810 38.9680)", srid=4326)
+    )
+    db.add_all([seller, client])
+    db.flush()
+    route = Route(seller_id=seller.id, client_id=client.id, planned_date=get_local_time().replace(tzinfo=None))
+    db.add(route)
+    db.flush()
+
+    now = get_local_time().replace(tzinfo=None)
+    for i in range(n):
+        flags = ["OUT_OF_RANGE|300m"] if i % 2 else ["MULTIPLE_LOCATIONS|2 check-ins en 1 minuto"]
+        db.add(Visit(
+            route_id=route.id, seller_id=seller.id, client_id=client.id,
+            checkin_time=now - timedelta(minutes=i + 1),
+            fraud_flags="|".join(flags), fraud_details=fraud_flags_to_details(flags)
+        ))
+    db.flush()
+
+
+def test_fraud_alerts_keyset_pages_in_constant_queries(client, db, query_counter):
+    _seed_alerts(db, 5)
+
+    query_counter.clear()
+    first = client.get("/dashboard/fraud-alerts/?limit=3").json()
+    assert len(query_counter) == 1
+
+    second = client.get(f"/dashboard/fraud-alerts/?limit=3&cursor={first['next_cursor']}").json()
+
+    ids = [a["visit_id"] for a in first["alerts"] + second["alerts"]]
+    assert len(ids) == len(set(ids)) >= 5
+    assert first["has_next"] is True
+    assert first["alerts"][0]["seller"] == "Seller Fraude"
+
+
+def test_fraud_alerts_filter_by_flag_type(client, db):
+    _seed_alerts(db, 4)
+
+    response = client.get("/dashboard/fraud-alerts/?flag=OUT_OF_RANGE")
+    assert response.status_code == 200
+    alerts = response.json()["alerts"]
+    assert alerts and all(a["flag_types"] == ["OUT_OF_RANGE"] for a in alerts)
+
+    assert client.get("/dashboard/fraud-alerts/?flag=NOPE").status_code == 400
@@ -0,0 +1,105 @@
+"""
+Análisis antifraude por lotes: velocidad, coordenadas idénticas y clústeres
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from main import FRAUD_SCORE_WEIGHTS, Visit, score_checkin_sequences
+
+T0 = np.datetime64("2025-03-10T09:00", "s")
+GANDIA = (38.9680, -0.1810)
+VALENCIA = (39.4699, -0.3763)
+
+
+def _minutes(*values):
+    return T0 + np.array(values) * 60
+
+
+def test_impossible_travel_only_within_the_same_seller():
+    signals = score_checkin_sequences(
+        seller_codes=[0, 0, 1],
+        client_codes=[0, 1, 2],
+        times=_minutes(0, 10, 11),
+        lats=[GANDIA[0], VALENCIA[0], GANDIA[0]],
+        lngs=[GANDIA[1], VALENCIA[1], GANDIA[1]],
+        client_lats=[GANDIA[0], VALENCIA[0], GANDIA[0]],
+        client_lngs=[GANDIA[1], VALENCIA[1], GANDIA[1]],
+    )
+
+    assert np.isnan(signals["speed_kmh"][0])
+    assert signals["speed_kmh"][1] > 300
+    assert np.isnan(signals["speed_kmh"][2])  # Cambio de vendedor: no hay tramo
+    assert signals["score"].tolist() == [0, FRAUD_SCORE_WEIGHTS["impossible_travel"], 0]
+
+
+def test_identical_coordinates_are_flagged():
+    lats = [38.968012, 38.968012, 38.9681]
+    lngs = [-0.181034, -0.181034, -0.1811]
+
+    signals = score_checkin_sequences([0, 0, 0], [0, 1, 2], _minutes(0, 40, 80), lats, lngs, lats, lngs)
+
+    assert signals["identical_coordinates"].tolist() == [1, 1, 0]
+
+
+def test_far_cluster_needs_several_clients_from_the_same_spot():
+    # Tres clientes distintos a ~5 km, "visitados" desde la misma calle
+    home = np.array([38.9680, 38.9681, 38.9680, 38.9500])
+    home_lng = np.array([-0.1810, -0.1811, -0.1812, -0.1500])
+    client_lats = np.array([39.0100, 38.9200, 39.0000, 38.9500])
+    client_lngs = np.array([-0.1810, -0.1810, -0.2300, -0.1500])
+
+    signals = score_checkin_sequences(
+        [0, 0, 0, 0], [0, 1, 2, 3], _minutes(0, 40, 80, 120), home, home_lng, client_lats, client_lngs
+    )
+
+    assert signals["far_cluster"].tolist() == [2, 2, 2, 0]
+    assert signals["score"][3] == 0
+
+
+def test_fraud_analysis_endpoint_writes_scores(client, db):
+    seller_id = client.post("/sellers/", json={
+        "name": "Seller Análisis",
+        "email": f"analysis-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    }).json()["id"]
+    client_id = client.post("/clients/", json={
+        "name": "Cliente Análisis",
+        "address": "Polígono Alcodar",
+        "phone": "962000000",
+        "client_type": "taller",
+        "latitude": GANDIA[0],
+        "longitude": GANDIA[1]
+    }).json()["id"]
+    route_id = client.post("/routes/", json={
+        "seller_id": seller_id,
+        "client_id": client_id,
+        "planned_date": "2025-03-10"
+    }).json()["id"]
+
+    # Mismo punto exacto dos veces (GPS simulado) y Valencia 5 minutos después
+    visits = []
+    for minutes, (lat, lng) in zip([0, 40, 45], [GANDIA, GANDIA, VALENCIA]):
+        visit = Visit(
+            route_id=route_id,
+            seller_id=seller_id,
+            client_id=client_id,
+            checkin_time=datetime(2025, 3, 10, 9, 0) + timedelta(minutes=minutes),
+            checkin_location=f"SRID=4326;POINT({lng} {lat})"
+        )
+        db.add(visit)
+        visits.append(visit)
+    db.flush()
+
+    response = client.post("/admin/fraud-analysis/", params={
+        "start_date": "2025-03-10", "seller_id": seller_id
+    }).json()
+
+    assert response["analyzed"] == 3
+    assert response["identical_coordinates"] == 2
+    assert response["impossible_travel"] == 1
+    for visit in visits:
+        db.refresh(visit)
+    assert [visit.fraud_score for visit in visits] == [0.3, 0.3, 0.4]
@@ -0,0 +1,79 @@
+"""
+Detector antifraude en memoria: ventanas deslizantes y viaje imposible
+"""
+from datetime import datetime, timedelta
+
+from main import (
+    CHECKIN_DUPLICATE_WINDOW, CheckinRecord, EventBus, FraudDetector, FraudSignals, validate_checkin
+)
+
+T0 = datetime(2025, 3, 10, 10, 0)
+GANDIA = (38.9680, -0.1810)
+OLIVA = (38.9197, -0.1199)  # ~7.5 km de Gandia
+VALENCIA = (39.4699, -0.3763)  # ~58 km de Gandia
+
+
+def _detector():
+    return FraudDetector(CHECKIN_DUPLICATE_WINDOW, buffer_size=50)
+
+
+def test_duplicate_and_multiple_location_windows():
+    detector = _detector()
+    detector.record("s1", CheckinRecord("v1", T0, "c1", *GANDIA))
+    detector.record("s1", CheckinRecord("v2", T0 + timedelta(minutes=30), "c2", *GANDIA))
+
+    # Mismo cliente a los 45 min: duplicado; c2 fue hace 15 min (> 60 s)
+    signals = detector.evaluate("s1", "c1", T0 + timedelta(minutes=45), *GANDIA)
+    assert (signals.recent_same_client, signals.recent_other_clients) == (1, 0)
+
+    # Otro cliente 30 s después de c2
+    signals = detector.evaluate("s1", "c3", T0 + timedelta(minutes=30, seconds=30), *GANDIA)
+    assert signals.recent_other_clients == 1
+
+    # Fuera de la ventana de 1 h ya no cuenta
+    signals = detector.evaluate("s1", "c1", T0 + timedelta(hours=1, minutes=1), *GANDIA)
+    assert signals.recent_same_client == 0
+
+
+def test_impossible_travel_speed():
+    detector = _detector()
+    detector.record("s1", CheckinRecord("v1", T0, "c1", *GANDIA))
+
+    # Valencia 10 min después: ~350 km/h
+    fast = detector.evaluate("s1", "c2", T0 + timedelta(minutes=10), *VALENCIA)
+    # Oliva 20 min después: ~22 km/h
+    normal = detector.evaluate("s1", "c2", T0 + timedelta(minutes=20), *OLIVA)
+
+    assert fast.travel_speed_kmh > 300
+    assert 15 < normal.travel_speed_kmh < 30
+    _, _, flags = validate_checkin(20, T0 + timedelta(minutes=10), True, fast)
+    assert any(flag.startswith("IMPOSSIBLE_TRAVEL|") for flag in flags)
+    _, _, flags = validate_checkin(20, T0 + timedelta(minutes=20), True, normal)
+    assert flags == []
+
+
+def test_buffer_is_bounded_and_deduplicated():
+    detector = FraudDetector(CHECKIN_DUPLICATE_WINDOW, buffer_size=3)
+    for i in range(10):
+        detector.record("s1", CheckinRecord(f"v{i}", T0 + timedelta(seconds=i), "c1", *GANDIA))
+    detector.record("s1", CheckinRecord("v9", T0 + timedelta(seconds=9), "c1", *GANDIA))
+
+    signals = detector.evaluate("s1", "c1", T0 + timedelta(minutes=1), *GANDIA)
+    assert signals == FraudSignals(3, 0, None)
+
+
+def test_detector_consumes_events_from_other_workers():
+    detector = _detector()
+    bus = EventBus("test_fraud_events")
+    bus.add_callback(detector.on_event)
+
+    bus.publish("checkin", {
+        "visit_id": "v1",
+        "seller_id": "s1",
+        "client_id": "c1",
+        "checkin_time": T0.isoformat(),
+        "latitude": GANDIA[0],
+        "longitude": GANDIA[1]
+    })
+
+    assert detector.evaluate("s1", "c1", T0 + timedelta(minutes=5), *GANDIA).recent_same_client == 1
@@ -0,0 +1,49 @@
+"""
+Kernel geo vectorizado: mismos resultados que calculate_distance (±1 mm)
+"""
+import random
+
+import numpy as np
+
+from main import calculate_distance, haversine_matrix, haversine_one_to_many
+
+
+def _random_points(n, seed=42):
+    rng = random.Random(seed)
+    # Península + algún punto lejano (Canarias) para cubrir distancias largas
+    points = [(rng.uniform(36.0, 43.5), rng.uniform(-9.0, 3.3)) for _ in range(n)]
+    points.append((28.1, -15.4))
+    return points
+
+
+def test_one_to_many_matches_calculate_distance():
+    points = _random_points(200)
+    lat, lng = 38.9680, -0.1810  # Gandia
+    distances = haversine_one_to_many(lat, lng, [p[0] for p in points], [p[1] for p in points])
+
+    expected = [calculate_distance(lat, lng, p[0], p[1]) for p in points]
+    assert np.max(np.abs(distances - expected)) < 0.001
+
+
+def test_matrix_matches_calculate_distance_and_is_symmetric():
+    points = _random_points(40)
+    lats, lngs = [p[0] for p in points], [p[1] for p in points]
+    matrix = haversine_matrix(lats, lngs)
+
+    assert matrix.shape == (len(points), len(points))
+    assert np.allclose(matrix, matrix.T)
+    assert np.all(np.diag(matrix) == 0)
+    for i in (0, 7, len(points) - 1):
+        for j in range(len(points)):
+            assert abs(matrix[i, j] - calculate_distance(lats[i], lngs[i], lats[j], lngs[j])) < 0.001
+
+
+def test_matrix_many_to_many_shape():
+    origins = _random_points(3, seed=1)
+    targets = _random_points(5, seed=2)
+    matrix = haversine_matrix(
+        [p[0] for p in origins], [p[1] for p in origins],
+        [p[0] for p in targets], [p[1] for p in targets]
+    )
+    assert matrix.shape == (4, 6)
+    assert abs(matrix[1, 2] - calculate_distance(*origins[1], *targets[2])) < 0.001
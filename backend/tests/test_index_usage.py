@@ -0,0 +1,65 @@
+"""
+Índices de los filtros calientes: EXPLAIN de las queries principales
+debe usar índices (requiere BD migrada: migrations/add_hot_filter_indexes.py).
+"""
+import uuid
+from datetime import datetime, timedelta
+
+from geoalchemy2 import Geography
+from sqlalchemy import cast, func
+
+from main import Base, Client, Route, Visit
+from migrations.add_hot_filter_indexes import BTREE_INDEXES
+
+
+def _explain(db, query) -> str:
+    compiled = query.statement.compile(dialect=db.bind.dialect)
+    params = {k: str(v) if isinstance(v, uuid.UUID) else v for k, v in compiled.params.items()}
+    # Tablas de test pequeñas: forzar al planner a mostrar si PUEDE usar un índice
+    db.execute(func.set_config("enable_seqscan", "off", True).select())
+    rows = db.connection().exec_driver_sql(f"EXPLAIN {compiled}", params).fetchall()
+    return "\n".join(row[0] for row in rows)
+
+
+def test_models_declare_the_migrated_index_set():
+    declared = {index.name for table in Base.metadata.tables.values() for index in table.indexes}
+    assert set(BTREE_INDEXES) <= declared
+
+
+def test_hot_filters_use_index_scans(db):
+    seller_id, client_id = uuid.uuid4(), uuid.uuid4()
+    now = datetime(2025, 3, 10, 12, 0)
+
+    queries = {
+        # validate_checkin: check-in duplicado en la última hora
+        "ix_visits_seller_client_checkin": db.query(Visit.id).filter(
+            Visit.seller_id == seller_id,
+            Visit.client_id == client_id,
+            Visit.checkin_time > now - timedelta(hours=1),
+            Visit.checkin_time < now
+        ),
+        # Feed de alertas de fraude (índice parcial)
+        "ix_visits_fraud_recent": db.query(Visit.id).filter(
+            Visit.fraud_flags.isnot(None),
+            Visit.checkin_time > now - timedelta(hours=24)
+        ).order_by(Visit.checkin_time.desc(), Visit.id.desc()).limit(50),
+        # Ruta del día de un vendedor
+        "ix_routes_seller_planned": db.query(Route.id).filter(
+            Route.seller_id == seller_id,
+            Route.planned_date >= now.replace(hour=0),
+            Route.planned_date < now.replace(hour=0) + timedelta(days=1)
+        ),
+        # Clientes cercanos (GiST)
+        "idx_clients_location": db.query(Client.id).filter(
+            func.ST_DWithin(
+                Client.location,
+                cast(func.ST_SetSRID(func.ST_MakePoint(-0.181, 38.968), 4326), Geography),
+                5000
+            )
+        ),
+    }
+
+    for index_name, query in queries.items():
+        plan = _explain(db, query)
+        assert index_name in plan, f"{index_name} no usado:\n{plan}"
+        assert "Seq Scan" not in plan, plan
@@ -0,0 +1,81 @@
+"""
+Mapa en vivo: última posición por vendedor servida desde memoria
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import LatestPositionStore, app, position_to_dict
+
+
+def _position(lat, lng, minutes_ago=0):
+    now = main.get_local_time().replace(tzinfo=None)
+    return position_to_dict(now - timedelta(minutes=minutes_ago), lat, lng, accuracy=5)
+
+
+def test_store_keeps_newest_fix_per_seller():
+    store = LatestPositionStore("test:positions", resync_seconds=60)
+    store.update("a", position_to_dict(datetime(2025, 3, 10, 11, 5), 38.97, -0.18))
+    store.update("a", position_to_dict(datetime(2025, 3, 10, 11, 0), 39.00, -0.20))  # llega tarde
+
+    snapshot = store.snapshot(lambda: {})
+
+    assert snapshot["a"]["latitude"] == 38.97
+
+
+def test_store_reloads_only_when_cold_or_stale():
+    store = LatestPositionStore("test:positions", resync_seconds=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"b": position_to_dict(datetime(2025, 3, 10, 11, 0), 38.92, -0.12)}
+
+    for _ in range(5):
+        assert "b" in store.snapshot(loader)
+    assert len(calls) == 1
+
+    store._synced_at -= 61
+    store.snapshot(loader)
+    assert len(calls) == 2
+
+
+def test_resync_drops_fixes_older_than_max_age():
+    store = LatestPositionStore("test:positions", resync_seconds=60, max_age=timedelta(hours=12))
+    store.update("activo", _position(38.97, -0.18, minutes_ago=5))
+    store.update("baja", _position(38.97, -0.18, minutes_ago=3 * 24 * 60))  # Vendedor desactivado
+
+    store._synced_at = None
+    snapshot = store.snapshot(lambda: {})
+
+    assert list(snapshot) == ["activo"]
+
+
+@pytest.fixture
+def live_store(monkeypatch):
+    store = LatestPositionStore("test:positions", resync_seconds=3600)
+    store.load({
+        "gandia": _position(38.9680, -0.1810, minutes_ago=2),
+        "oliva": _position(38.9197, -0.1199, minutes_ago=1),
+        "ayer": _position(38.9680, -0.1810, minutes_ago=24 * 60),
+    })
+    monkeypatch.setattr(main, "LIVE_POSITIONS", store)
+    return store
+
+
+def test_live_positions_filters_bbox_and_stale_fixes(live_store):
+    client = TestClient(app)
+
+    everyone = client.get("/tracking/positions/").json()
+    gandia_only = client.get("/tracking/positions/", params={"bbox": "-0.20,38.95,-0.15,39.00"}).json()
+
+    assert [p["seller_id"] for p in everyone["positions"]] == ["oliva", "gandia"]
+    assert [p["seller_id"] for p in gandia_only["positions"]] == ["gandia"]
+
+
+def test_live_positions_rejects_invalid_bbox(live_store):
+    client = TestClient(app)
+    assert client.get("/tracking/positions/", params={"bbox": "1,2,3"}).status_code == 400
+    assert client.get("/tracking/positions/", params={"bbox": "1,2,0,3"}).status_code == 400
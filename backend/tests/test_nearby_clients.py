@@ -0,0 +1,46 @@
+"""
+Tests para GET /clients/nearby/ (KNN ordenado + filtros)
+"""
+
+
+def _create_client(client, name, latitude, longitude, client_type="cristalero", status="active"):
+    resp = client.post("/clients/", json={
+        "name": name,
+        "address": "Polígono Alcodar, Gandia",
+        "phone": "962000000",
+        "client_type": client_type,
+        "status": status,
+        "latitude": latitude,
+        "longitude": longitude
+    })
+    assert resp.status_code == 200
+    return resp.json()["id"]
+
+
+def test_nearby_ordered_nearest_first_and_limited(client):
+    far_id = _create_client(client, "Lejano", 38.9900, -0.1810)
+    near_id = _create_client(client, "Cercano", 38.9681, -0.1810)
+    mid_id = _create_client(client, "Medio", 38.9750, -0.1810)
+
+    resp = client.get("/clients/nearby/?latitude=38.9680&longitude=-0.1810&radius_km=5")
+    assert resp.status_code == 200
+    ids = [c["id"] for c in resp.json() if c["id"] in (far_id, near_id, mid_id)]
+    assert ids == [near_id, mid_id, far_id]
+
+    distances = [c["distance_meters"] for c in resp.json()]
+    assert distances == sorted(distances)
+
+    resp = client.get("/clients/nearby/?latitude=38.9680&longitude=-0.1810&radius_km=5&limit=1")
+    assert len(resp.json()) == 1
+    assert resp.json()[0]["id"] == near_id
+
+
+def test_nearby_filters_type_and_status(client):
+    taller_id = _create_client(client, "Taller", 38.9681, -0.1811, client_type="taller")
+    inactive_id = _create_client(client, "Inactivo", 38.9682, -0.1812, client_type="taller", status="inactive")
+
+    resp = client.get("/clients/nearby/?latitude=38.9680&longitude=-0.1810&radius_km=1&client_type=taller&status=active")
+    ids = [c["id"] for c in resp.json()]
+    assert taller_id in ids
+    assert inactive_id not in ids
+    assert all(c["client_type"] == "taller" and c["status"] == "active" for c in resp.json())
@@ -0,0 +1,161 @@
+"""
+Cola offline: replay de check-ins/check-outs con claves de idempotencia
+"""
+import uuid
+from datetime import datetime, timedelta
+
+from main import (
+    CHECKIN_DUPLICATE_WINDOW, CheckinRecord, FraudDetector, OfflineVisitAction, Visit,
+    prepare_offline_actions, replay_checkin_history
+)
+
+NOW = datetime(2025, 3, 10, 11, 0)
+GANDIA = (38.9680, -0.1810)
+
+
+def _checkin(key, minutes_ago, **extra):
+    return OfflineVisitAction(**{
+        "type": "checkin",
+        "idempotency_key": key,
+        "captured_at": NOW - timedelta(minutes=minutes_ago),
+        "latitude": GANDIA[0],
+        "longitude": GANDIA[1],
+        "route_id": str(uuid.uuid4()),
+        "client_id": str(uuid.uuid4()),
+        **extra
+    })
+
+
+def test_prepare_sorts_by_capture_time_and_rejects_invalid_actions():
+    actions = [
+        _checkin("b", 10),
+        _checkin("a", 30),
+        _checkin("a", 5),                                  # clave repetida en el lote
+        _checkin("old", 30 * 24 * 60),                     # demasiado antigua
+        _checkin("bad-ids", 1, client_id="cliente-1"),     # ID no UUID
+        OfflineVisitAction(
+            type="checkout", idempotency_key="out", captured_at=NOW,
+            latitude=GANDIA[0], longitude=GANDIA[1]        # sin visit_id ni checkin_key
+        ),
+    ]
+
+    valid, results = prepare_offline_actions(actions, NOW)
+
+    assert [action.idempotency_key for _, action, _ in valid] == ["a", "b"]
+    assert results[2]["status"] == "duplicate"
+    assert [results[position]["status"] for position in (3, 4, 5)] == ["rejected"] * 3
+
+
+def test_prepare_converts_aware_timestamps_to_local_time():
+    action = _checkin("utc", 0, captured_at="2025-03-10T09:30:00Z")
+
+    valid, _ = prepare_offline_actions([action], NOW)
+
+    assert valid[0][2] == datetime(2025, 3, 10, 10, 30)  # Madrid = UTC+1 en marzo
+
+
+def test_history_after_a_capture_does_not_hide_earlier_check_ins():
+    detector = FraudDetector(CHECKIN_DUPLICATE_WINDOW, buffer_size=50)
+    history = [
+        CheckinRecord("v1", datetime(2025, 3, 10, 9, 0), "c1", *GANDIA),
+        CheckinRecord("v9", datetime(2025, 3, 10, 12, 0), "c9", *GANDIA),  # Check-in online posterior
+    ]
+    capture = datetime(2025, 3, 10, 9, 20)
+
+    replayed = replay_checkin_history(detector, "s1", history, 0, capture)
+    signals = detector.evaluate("s1", "c1", capture, *GANDIA)
+
+    assert replayed == 1
+    assert signals.recent_same_client == 1
+    assert replay_checkin_history(detector, "s1", history, replayed, datetime(2025, 3, 10, 12, 30)) == 2
+
+
+def _seller_client_route(client, planned_date):
+    seller_id = client.post("/sellers/", json={
+        "name": "Seller Offline",
+        "email": f"offline-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    }).json()["id"]
+    client_id = client.post("/clients/", json={
+        "name": "Cliente Sin Cobertura",
+        "address": "Polígono Alcodar",
+        "phone": "962000000",
+        "client_type": "taller",
+        "latitude": GANDIA[0],
+        "longitude": GANDIA[1]
+    }).json()["id"]
+    route_id = client.post("/routes/", json={
+        "seller_id": seller_id,
+        "client_id": client_id,
+        "planned_date": planned_date.date().isoformat()
+    }).json()["id"]
+    return seller_id, client_id, route_id
+
+
+def test_resent_batch_does_not_duplicate_visits(client, db):
+    captured = (datetime.now() - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    seller_id, client_id, route_id = _seller_client_route(client, captured)
+    batch = {
+        "seller_id": seller_id,
+        "actions": [
+            {
+                "type": "checkin",
+                "idempotency_key": "in-1",
+                "captured_at": captured.isoformat(),
+                "latitude": GANDIA[0],
+                "longitude": GANDIA[1],
+                "route_id": route_id,
+                "client_id": client_id
+            },
+            {
+                "type": "checkout",
+                "idempotency_key": "out-1",
+                "captured_at": (captured + timedelta(minutes=25)).isoformat(),
+                "latitude": GANDIA[0],
+                "longitude": GANDIA[1],
+                "checkin_key": "in-1"
+            }
+        ]
+    }
+
+    first = client.post("/visits/sync/", json=batch).json()
+    again = client.post("/visits/sync/", json=batch).json()
+
+    assert (first["created"], first["duplicates"]) == (2, 0)
+    assert first["results"][0]["validity_status"] == "valid_1"  # Hora de captura, no de llegada
+    assert (again["created"], again["duplicates"]) == (0, 2)
+    assert again["results"][0]["visit_id"] == first["results"][0]["visit_id"]
+
+    visits = db.query(Visit).filter(Visit.seller_id == seller_id).all()
+    assert len(visits) == 1
+    assert visits[0].checkin_time == captured
+    assert visits[0].checkout_time == captured + timedelta(minutes=25)
+
+
+def test_offline_capture_flags_duplicate_despite_later_online_checkin(client, db):
+    captured = (datetime.now() - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    seller_id, client_id, route_id = _seller_client_route(client, captured)
+    # Online: 10:00 en el cliente y 13:00 (ya con cobertura), antes de sincronizar
+    for moment in (captured, captured + timedelta(hours=3)):
+        db.add(Visit(
+            route_id=route_id, seller_id=seller_id, client_id=client_id, checkin_time=moment,
+            checkin_location=f"SRID=4326;POINT({GANDIA[1]} {GANDIA[0]})"
+        ))
+    db.flush()
+
+    response = client.post("/visits/sync/", json={
+        "seller_id": seller_id,
+        "actions": [{
+            "type": "checkin",
+            "idempotency_key": f"in-{uuid.uuid4().hex[:8]}",
+            "captured_at": (captured + timedelta(minutes=20)).isoformat(),
+            "latitude": GANDIA[0],
+            "longitude": GANDIA[1],
+            "route_id": route_id,
+            "client_id": client_id
+        }]
+    }).json()
+
+    flags = response["results"][0]["fraud_flags"] or []
+    assert any(flag.startswith("DUPLICATE_CHECKIN|") for flag in flags)
@@ -0,0 +1,103 @@
+"""
+Breadcrumbs GPS: validación, decimación Douglas-Peucker e ingesta por lotes
+"""
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from main import (
+    PositionFix, app, douglas_peucker, get_positions_db, prepare_position_fixes, upcoming_position_months
+)
+
+NOW = datetime(2025, 3, 10, 11, 0)
+
+
+def _fix(lat, lng, seconds_ago, accuracy=8.0):
+    return PositionFix(latitude=lat, longitude=lng, recorded_at=NOW - timedelta(seconds=seconds_ago), accuracy=accuracy)
+
+
+def test_douglas_peucker_keeps_corners_and_drops_straight_runs():
+    # Recta hacia el norte y giro de 90º hacia el este (~11 m entre fixes)
+    lats = [38.9680 + i * 0.0001 for i in range(20)] + [38.9699] * 20
+    lngs = [-0.1810] * 20 + [-0.1810 + i * 0.00013 for i in range(1, 21)]
+
+    keep = douglas_peucker(lats, lngs, tolerance_m=5)
+
+    assert keep == [0, 19, 39]
+
+
+def test_douglas_peucker_keeps_out_and_back_trip():
+    # Ida y vuelta: primer y último punto coinciden, el extremo no se puede perder
+    lats = [38.9680, 38.9700, 38.9720, 38.9700, 38.9680]
+    lngs = [-0.1810] * 5
+
+    assert 2 in douglas_peucker(lats, lngs, tolerance_m=10)
+
+
+def test_prepare_rejects_invalid_fixes_and_sorts():
+    fixes = [
+        _fix(38.9690, -0.1810, 30),
+        _fix(38.9680, -0.1810, 60),
+        _fix(120.0, -0.1810, 10),                       # coordenada imposible
+        _fix(38.9700, -0.1810, 20, accuracy=500),       # precisión insuficiente
+        _fix(38.9700, -0.1810, 30 * 24 * 3600),         # demasiado antiguo
+        _fix(38.9700, -0.1810, -3600),                  # en el futuro
+    ]
+
+    track, rejected = prepare_position_fixes(fixes, NOW)
+
+    assert rejected == 4
+    assert [recorded_at for recorded_at, _ in track] == sorted(recorded_at for recorded_at, _ in track)
+    assert len(track) == 2
+
+
+def test_upcoming_position_months_crosses_year():
+    months = upcoming_position_months(date(2025, 12, 20))
+    assert months[:2] == [date(2025, 12, 1), date(2026, 1, 1)]
+
+
+@pytest.fixture
+def positions_client(client, db):
+    app.dependency_overrides[get_positions_db] = lambda: db
+    yield client
+    del app.dependency_overrides[get_positions_db]
+
+
+def test_ingest_batch_is_idempotent(positions_client):
+    seller_id = positions_client.post("/sellers/", json={
+        "name": "Seller Breadcrumbs",
+        "email": f"gps-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    }).json()["id"]
+    start = datetime.now() - timedelta(minutes=30)
+    batch = {
+        "seller_id": seller_id,
+        "fixes": [
+            {
+                "latitude": 38.9680 + i * 0.0001,
+                "longitude": -0.1810 + (0.0003 if i >= 50 else 0),
+                "recorded_at": (start + timedelta(seconds=5 * i)).isoformat(),
+                "accuracy": 6
+            }
+            for i in range(100)
+        ]
+    }
+
+    first = positions_client.post("/positions/batch/", json=batch).json()
+    again = positions_client.post("/positions/batch/", json=batch).json()
+    track = positions_client.get(
+        f"/sellers/{seller_id}/positions/", params={"date": start.date().isoformat()}
+    ).json()
+
+    assert first["received"] == 100
+    assert 2 <= first["stored"] < 100
+    assert first["decimated"] == 100 - first["stored"]
+    assert again == {**first, "stored": 0}  # Reenvío: nada nuevo insertado
+    assert track["count"] == first["stored"]
+
+
+def test_ingest_rejects_unknown_seller(positions_client):
+    response = positions_client.post("/positions/batch/", json={"seller_id": str(uuid.uuid4()), "fixes": []})
+    assert response.status_code == 404
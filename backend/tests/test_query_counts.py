@@ -0,0 +1,98 @@
+"""
+Regresión N+1: los endpoints con clientes deben hacer un número
+constante de queries, independientemente del tamaño del resultado.
+"""
+import uuid
+from datetime import date
+
+from main import FRAUD_DETECTOR
+
+
+def _seed_seller_with_clients(client, n_clients):
+    """Crea un vendedor con N clientes, N rutas diarias y una SalesRoute"""
+    seller_resp = client.post("/sellers/", json={
+        "name": "Seller N+1",
+        "email": f"n1-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    })
+    seller_id = seller_resp.json()["id"]
+
+    sales_route_resp = client.post("/sales-routes/", json={"name": "Ruta N+1", "seller_id": seller_id})
+    sales_route_id = sales_route_resp.json()["id"]
+
+    for i in range(n_clients):
+        client_resp = client.post("/clients/", json={
+            "name": f"Cliente N+1 {i}",
+            "address": f"Calle Gandia {i}",
+            "phone": "961000000",
+            "client_type": "carpintero_metalico",
+            "status": "active",
+            "latitude": 38.9680 + i * 0.0005,
+            "longitude": -0.1810 - i * 0.0005
+        })
+        client_id = client_resp.json()["id"]
+        client.put(f"/clients/{client_id}/assign-route/", json={"sales_route_id": sales_route_id})
+        client.post("/routes/", json={
+            "seller_id": seller_id,
+            "client_id": client_id,
+            "planned_date": date.today().isoformat()
+        })
+
+    return seller_id
+
+
+def _count_queries(client, query_counter, url):
+    query_counter.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return len(query_counter), response.json()
+
+
+def test_client_endpoints_constant_query_count(client, query_counter):
+    small_seller = _seed_seller_with_clients(client, 1)
+    large_seller = _seed_seller_with_clients(client, 6)
+
+    urls = [
+        "/routes/?seller_id={seller_id}",
+        "/seller/{seller_id}/history/?months=6",
+        "/my-route-customers/?seller_id={seller_id}",
+    ]
+
+    for url in urls:
+        small_count, small_data = _count_queries(client, query_counter, url.format(seller_id=small_seller))
+        large_count, large_data = _count_queries(client, query_counter, url.format(seller_id=large_seller))
+        assert small_count == large_count, f"{url}: {small_count} vs {large_count} queries"
+
+
+def test_nearby_clients_constant_query_count(client, query_counter):
+    _seed_seller_with_clients(client, 6)
+
+    few_count, few = _count_queries(client, query_counter, "/clients/nearby/?latitude=38.9680&longitude=-0.1810&radius_km=0.01")
+    many_count, many = _count_queries(client, query_counter, "/clients/nearby/?latitude=38.9680&longitude=-0.1810&radius_km=5")
+
+    assert len(many) > len(few)
+    assert few_count == many_count
+    assert all(c["latitude"] is not None and c["distance_meters"] is not None for c in many)
+
+
+def test_checkin_is_one_select_and_one_insert(client, query_counter, monkeypatch):
+    monkeypatch.setattr(FRAUD_DETECTOR, "warmed", True)  # La precarga es única por proceso
+    seller_id = _seed_seller_with_clients(client, 1)
+    route = client.get(f"/routes/?seller_id={seller_id}").json()[0]
+
+    query_counter.clear()
+    response = client.post("/visits/checkin/", json={
+        "route_id": route["id"],
+        "seller_id": seller_id,
+        "client_id": route["client_id"],
+        "latitude": 38.9680,
+        "longitude": -0.1810,
+        "client_found": True
+    })
+
+    assert response.status_code == 200, response.text
+    assert len(query_counter) == 2, query_counter
+    assert response.json()["distance_meters"] < 1
+    routes = client.get(f"/routes/?seller_id={seller_id}").json()
+    assert routes[0]["status"] == "completed"
@@ -0,0 +1,98 @@
+"""
+Optimizador de rutas: TSP abierto (vecino más cercano + 2-opt + Or-opt)
+"""
+import itertools
+import random
+import uuid
+from datetime import date
+
+import numpy as np
+import pytest
+
+from main import haversine_matrix, haversine_one_to_many, optimize_visit_order, path_length
+
+BASE_LAT, BASE_LNG = 38.9680, -0.1810
+
+
+def _random_stops(n, seed):
+    rng = random.Random(seed)
+    lats = np.array([BASE_LAT + rng.uniform(-0.4, 0.4) for _ in range(n)])
+    lngs = np.array([BASE_LNG + rng.uniform(-0.5, 0.5) for _ in range(n)])
+    return lats, lngs
+
+
+def test_small_routes_are_near_optimal():
+    for seed in range(30):
+        lats, lngs = _random_stops(6, seed)
+        matrix = haversine_matrix(lats, lngs)
+        start = haversine_one_to_many(BASE_LAT, BASE_LNG, lats, lngs)
+
+        order = optimize_visit_order(matrix, start)
+        best = min(path_length(list(p), matrix, start) for p in itertools.permutations(range(6)))
+
+        assert sorted(order) == list(range(6))
+        assert path_length(order, matrix, start) <= best * 1.05
+
+
+def test_or_opt_can_move_the_last_stop():
+    # Semilla en la que el óptimo exige recolocar la parada final (antes ~1,2 % peor)
+    lats, lngs = _random_stops(6, seed=276)
+    matrix = haversine_matrix(lats, lngs)
+    start = haversine_one_to_many(BASE_LAT, BASE_LNG, lats, lngs)
+
+    order = optimize_visit_order(matrix, start)
+    best = min(path_length(list(p), matrix, start) for p in itertools.permutations(range(6)))
+
+    assert path_length(order, matrix, start) == pytest.approx(best)
+
+
+def test_sixty_stops_improve_on_nearest_neighbour():
+    # El tiempo (< 200 ms) se mide en benchmarks/route_optimizer.py
+    lats, lngs = _random_stops(60, seed=60)
+    matrix = haversine_matrix(lats, lngs)
+
+    order = optimize_visit_order(matrix)
+    nearest_neighbour = optimize_visit_order(matrix, max_passes=0)  # Sin búsqueda local
+
+    assert sorted(order) == list(range(60))
+    assert path_length(order, matrix) <= path_length(nearest_neighbour, matrix)
+    assert path_length(order, matrix) < path_length(list(range(60)), matrix)
+
+
+def test_optimize_endpoint_persists_visit_order(client):
+    seller_id = client.post("/sellers/", json={
+        "name": "Seller Optimizer",
+        "email": f"opt-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    }).json()["id"]
+
+    # Paradas en zigzag: el orden de creación es claramente peor que el óptimo
+    for i, offset in enumerate([0.0, 0.08, 0.01, 0.07, 0.02, 0.06]):
+        client_id = client.post("/clients/", json={
+            "name": f"Cliente Optimizer {i}",
+            "address": "Polígono Alcodar",
+            "phone": "962000000",
+            "client_type": "taller",
+            "latitude": BASE_LAT + offset,
+            "longitude": BASE_LNG
+        }).json()["id"]
+        client.post("/routes/", json={
+            "seller_id": seller_id,
+            "client_id": client_id,
+            "planned_date": date.today().isoformat()
+        })
+
+    response = client.post("/routes/optimize/", json={
+        "seller_id": seller_id,
+        "start_latitude": BASE_LAT,
+        "start_longitude": BASE_LNG
+    })
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["stops"] == 6
+    assert result["saved_km"] > 0
+
+    routes = client.get(f"/routes/?seller_id={seller_id}").json()
+    persisted = {r["id"]: r["visit_order"] for r in routes}
+    assert [persisted[stop["route_id"]] for stop in result["order"]] == list(range(6))
@@ -0,0 +1,125 @@
+"""
+Migraciones de esquema versionadas (schema_migrations + advisory lock)
+"""
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import main
+from main import (
+    HOT_FILTER_INDEXES_V9, SCHEMA_MIGRATIONS, Client, Route, Visit,
+    apply_schema_migrations, pending_schema_migrations
+)
+
+# Esquema de producción anterior a las migraciones versionadas (sin las
+# columnas que añaden v3-v13): una BD real se migra desde aquí
+BASELINE_DDL = [
+    """CREATE TABLE sellers (
+        id UUID PRIMARY KEY, name VARCHAR(255) NOT NULL, email VARCHAR(255) UNIQUE NOT NULL,
+        phone VARCHAR(20) NOT NULL, password_hash VARCHAR(255), is_active BOOLEAN, created_at TIMESTAMP
+    )""",
+    """CREATE TABLE zones (
+        id UUID PRIMARY KEY, name VARCHAR(255) NOT NULL, geometry geometry(POLYGON, 4326), created_at TIMESTAMP
+    )""",
+    """CREATE TABLE sales_routes (
+        id UUID PRIMARY KEY, name VARCHAR(255) NOT NULL, zone_id UUID REFERENCES zones(id),
+        seller_id UUID REFERENCES sellers(id), created_at TIMESTAMP
+    )""",
+    """CREATE TABLE clients (
+        id UUID PRIMARY KEY, name VARCHAR(255) NOT NULL, address VARCHAR(255) NOT NULL,
+        phone VARCHAR(20) NOT NULL, email VARCHAR(255), location geography(POINT, 4326) NOT NULL,
+        client_type VARCHAR(50) NOT NULL, status VARCHAR(20), created_at TIMESTAMP
+    )""",
+    """CREATE TABLE routes (
+        id UUID PRIMARY KEY, seller_id UUID NOT NULL REFERENCES sellers(id),
+        client_id UUID NOT NULL REFERENCES clients(id), planned_date TIMESTAMP NOT NULL,
+        status VARCHAR(20), created_at TIMESTAMP
+    )""",
+    """CREATE TABLE visits (
+        id UUID PRIMARY KEY, route_id UUID NOT NULL REFERENCES routes(id),
+        seller_id UUID NOT NULL REFERENCES sellers(id), client_id UUID NOT NULL REFERENCES clients(id),
+        checkin_time TIMESTAMP, checkin_location geography(POINT, 4326), checkin_distance_meters FLOAT,
+        checkin_photo_url VARCHAR(500), checkin_is_valid BOOLEAN, checkin_validation_error VARCHAR(255),
+        checkout_time TIMESTAMP, checkout_location geography(POINT, 4326), checkout_distance_meters FLOAT,
+        fraud_flags TEXT, notes TEXT, created_at TIMESTAMP
+    )""",
+]
+
+
+def test_migration_versions_are_unique_and_ordered():
+    versions = [migration.version for migration in SCHEMA_MIGRATIONS]
+    assert versions == sorted(set(versions))
+
+
+def test_pending_skips_applied_and_optionally_retries_skipped():
+    applied = {migration.version: False for migration in SCHEMA_MIGRATIONS}
+    assert pending_schema_migrations(applied) == []
+    assert len(pending_schema_migrations(None)) == len(SCHEMA_MIGRATIONS)
+
+    skipped = SCHEMA_MIGRATIONS[-1].version
+    applied[skipped] = True
+    assert pending_schema_migrations(applied) == []
+    assert [m.version for m in pending_schema_migrations(applied, retry_skipped=True)] == [skipped]
+
+
+def test_hot_filter_migration_is_frozen():
+    # Índices nuevos de los modelos van en su propia migración, no en v9
+    model_indexes = {
+        index.name for table in (Client.__table__, Route.__table__, Visit.__table__) for index in table.indexes
+    }
+    assert model_indexes - set(HOT_FILTER_INDEXES_V9) == {"ux_visits_idempotency_key"}
+
+
+@pytest.fixture
+def scratch_engine(test_db_engine, monkeypatch):
+    """
+    main.engine apuntando a un esquema temporal (search_path): el DDL y
+    schema_migrations de la prueba no tocan el esquema compartido de tests.
+    """
+    schema = f"test_migrations_{uuid.uuid4().hex[:8]}"
+    with test_db_engine.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    scratch = create_engine(test_db_engine.url, connect_args={"options": f"-csearch_path={schema},public"})
+    monkeypatch.setattr(main, "engine", scratch)
+    yield scratch
+    scratch.dispose()
+    with test_db_engine.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+def test_concurrent_workers_migrate_once(scratch_engine):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(apply_schema_migrations())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert all(set(result) == {m.version for m in SCHEMA_MIGRATIONS} for result in results)
+    with scratch_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM schema_migrations")).scalar() == len(SCHEMA_MIGRATIONS)
+
+
+def test_migrates_baseline_production_schema(scratch_engine):
+    with scratch_engine.begin() as conn:
+        for statement in BASELINE_DDL:
+            conn.execute(text(statement))
+
+    applied = apply_schema_migrations()
+
+    assert set(applied) == {m.version for m in SCHEMA_MIGRATIONS}
+    with scratch_engine.connect() as conn:
+        indexes = set(conn.execute(text(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = 'visits'"
+        )).scalars())
+    assert {"ux_visits_idempotency_key", *[n for n in HOT_FILTER_INDEXES_V9 if n.startswith("ix_visits")]} <= indexes
@@ -0,0 +1,116 @@
+"""
+Tracking de ruta: distancia restante real y ETA con perfil de velocidad
+"""
+import uuid
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from main import TRACKING_SETTINGS, build_tracking, calculate_distance, estimate_remaining_route
+
+RouteRow = namedtuple("RouteRow", "id status client_name client_address latitude longitude")
+CheckinRow = namedtuple("CheckinRow", "checkin_time checkout_time latitude longitude")
+
+GANDIA = (38.9680, -0.1810)
+OLIVA = (38.9197, -0.1199)
+TAVERNES = (39.0717, -0.2665)
+
+
+def test_remaining_route_goes_through_all_pending_stops():
+    estimate = estimate_remaining_route(GANDIA, [OLIVA, TAVERNES], dwell_minutes=20)
+
+    straight_km = (calculate_distance(*GANDIA, *OLIVA) + calculate_distance(*OLIVA, *TAVERNES)) / 1000
+    assert abs(estimate["remaining_km"] - straight_km * TRACKING_SETTINGS["road_factor"]) < 0.001
+    assert estimate["next_km"] < estimate["remaining_km"]
+    # Conducción + 20 min en cada una de las 2 paradas
+    assert estimate["route_eta_min"] > estimate["next_eta_min"] + 40
+
+
+def test_build_tracking_uses_last_checkin_and_open_visit_dwell():
+    now = datetime(2025, 3, 10, 11, 0)
+    routes = [
+        RouteRow(uuid.uuid4(), "completed", "Cliente Gandia", "Gandia", *GANDIA),
+        RouteRow(uuid.uuid4(), "pending", "Cliente Oliva", "Oliva", *OLIVA),
+    ]
+    # Lleva 5 min en la parada de Gandia (sin check-out)
+    checkin = CheckinRow(now - timedelta(minutes=5), None, *GANDIA)
+
+    tracking = build_tracking(routes, checkin, dwell_minutes=20, now=now)
+
+    assert tracking["start_point"] == "last_checkin"
+    assert tracking["current_client_name"] == "Cliente Oliva"
+    assert tracking["progress_percentage"] == 50
+    drive = estimate_remaining_route(GANDIA, [OLIVA], 20)["next_eta_min"]
+    assert tracking["eta_minutes"] == round(15 + drive)
+
+
+def test_build_tracking_without_checkin_starts_at_hq():
+    tracking = build_tracking([], None, dwell_minutes=20, now=datetime(2025, 3, 10, 9, 0))
+    assert tracking["start_point"] == "hq"
+    assert tracking["distance_remaining_km"] == 0
+
+
+def test_tracking_endpoint_constant_queries(client, query_counter):
+    seller_id = client.post("/sellers/", json={
+        "name": "Seller Tracking",
+        "email": f"track-{uuid.uuid4().hex[:8]}@test.com",
+        "phone": "600000000",
+        "is_active": True
+    }).json()["id"]
+
+    counts = []
+    for i in range(4):
+        client_id = client.post("/clients/", json={
+            "name": f"Cliente Tracking {i}",
+            "address": "Polígono Alcodar",
+            "phone": "962000000",
+            "client_type": "taller",
+            "latitude": GANDIA[0] + i * 0.01,
+            "longitude": GANDIA[1]
+        }).json()["id"]
+        client.post("/routes/", json={
+            "seller_id": seller_id,
+            "client_id": client_id,
+            "planned_date": date.today().isoformat()
+        })
+
+        query_counter.clear()
+        tracking = client.get(f"/sellers/{seller_id}/tracking/today").json()
+        counts.append(len(query_counter))
+
+    assert tracking["pending_stops"] == 4
+    assert tracking["distance_remaining_km"] > 0
+    assert len(set(counts)) == 1
+
+
+def test_fleet_tracking_constant_queries(client, query_counter):
+    counts = []
+    for i in range(3):
+        seller_id = client.post("/sellers/", json={
+            "name": f"Seller Flota {i}",
+            "email": f"fleet-{uuid.uuid4().hex[:8]}@test.com",
+            "phone": "600000000",
+            "is_active": True
+        }).json()["id"]
+        client_id = client.post("/clients/", json={
+            "name": f"Cliente Flota {i}",
+            "address": "Polígono Alcodar",
+            "phone": "962000000",
+            "client_type": "taller",
+            "latitude": GANDIA[0] + i * 0.01,
+            "longitude": GANDIA[1]
+        }).json()["id"]
+        client.post("/routes/", json={
+            "seller_id": seller_id,
+            "client_id": client_id,
+            "planned_date": date.today().isoformat()
+        })
+
+        query_counter.clear()
+        fleet = client.get("/tracking/today").json()
+        counts.append(len(query_counter))
+
+    assert fleet["total_sellers"] >= 3
+    tracked = {s["seller_id"]: s for s in fleet["sellers"]}
+    assert tracked[seller_id]["pending_stops"] == 1
+    assert tracked[seller_id]["distance_remaining_km"] > 0
+    assert len(set(counts)) == 1
@@ -0,0 +1,41 @@
+"""
+Pub/sub de eventos de visitas (no requiere PostgreSQL)
+"""
+import asyncio
+import threading
+
+from main import EventBus
+
+
+def test_event_bus_delivers_events_published_from_other_threads():
+    bus = EventBus("test_events")
+
+    async def scenario():
+        queue = bus.subscribe()
+        publisher = threading.Thread(target=bus.publish, args=("checkin", {"visit_id": "v1", "fraud_flags": []}))
+        publisher.start()
+        publisher.join()
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        bus.unsubscribe(queue)
+        return event
+
+    event = asyncio.run(scenario())
+    assert event == {"event": "checkin", "data": {"visit_id": "v1", "fraud_flags": []}}
+
+
+def test_event_bus_drops_events_for_slow_subscribers():
+    bus = EventBus("test_events_slow", queue_size=2)
+
+    async def scenario():
+        queue = bus.subscribe()
+        for i in range(5):
+            bus.publish("checkout", {"visit_id": str(i)})
+        await asyncio.sleep(0)
+        received = []
+        while not queue.empty():
+            received.append(queue.get_nowait()["data"]["visit_id"])
+        bus.unsubscribe(queue)
+        return received
+
+    assert asyncio.run(scenario()) == ["0", "1"]
+    assert bus._subscribers == []
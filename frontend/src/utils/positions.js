@@ -0,0 +1,61 @@
+// ============================================================================
+// 📍 BREADCRUMBS GPS: buffer de posiciones y envío por lotes
+// ============================================================================
+// watchPosition dispara cada pocos segundos: en lugar de una petición por
+// fix, se acumulan y se envían a POST /positions/batch/ cada FLUSH_MS o al
+// llegar a FLUSH_SIZE. Si no hay red, el lote se reintenta en el siguiente
+// envío (el backend ignora duplicados).
+
+const FLUSH_MS = 30000
+const FLUSH_SIZE = 200
+const MAX_BUFFER = 5000
+
+export const createPositionBuffer = (sellerId) => {
+  let buffer = []
+  let sending = false
+  let timer = null
+
+  const flush = async ({ keepalive = false } = {}) => {
+    if (sending || buffer.length === 0 || !sellerId) return
+    sending = true
+    const fixes = buffer
+    buffer = []
+    try {
+      const response = await fetch(`${import.meta.env.VITE_API_URL}/positions/batch/`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ seller_id: sellerId, fixes }),
+        keepalive
+      })
+      if (!response.ok && response.status >= 500) throw new Error(`HTTP ${response.status}`)
+    } catch (e) {
+      // Sin red: devolver al buffer (los más recientes primero si se llena)
+      buffer = fixes.concat(buffer).slice(-MAX_BUFFER)
+      console.error('⚠️ Error enviando posiciones:', e.message)
+    } finally {
+      sending = false
+    }
+  }
+
+  const push = (position) => {
+    buffer.push({
+      latitude: position.coords.latitude,
+      longitude: position.coords.longitude,
+      accuracy: position.coords.accuracy,
+      speed: position.coords.speed,
+      heading: position.coords.heading,
+      recorded_at: new Date(position.timestamp).toISOString()
+    })
+    if (buffer.length > MAX_BUFFER) buffer.shift()
+    if (buffer.length >= FLUSH_SIZE) flush()
+  }
+
+  timer = setInterval(flush, FLUSH_MS)
+
+  const stop = () => {
+    clearInterval(timer)
+    flush({ keepalive: true })
+  }
+
+  return { push, flush, stop }
+}